@@ -0,0 +1,132 @@
+"""
+Command line entry point for the taxi demand pipeline.
+
+    python -m src.taxi_demand run                          # full training pipeline
+    python -m src.taxi_demand run --stage data_validation  # a single stage
+    python -m src.taxi_demand bench-import                 # cold-start import guard
+
+Only the standard library is imported at module level; pipeline stages are
+imported when they run.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules that are imported on every start-up and must stay cheap
+IMPORT_BENCHMARK_STARTUP_MODULES = [
+    "src.taxi_demand.cli",
+    "src.taxi_demand.logging.logger",
+    "src.taxi_demand.exception.exception",
+    "src.taxi_demand.entity.config_entity",
+    "src.taxi_demand.pipeline.training_pipeline",
+]
+# Modules that may import pandas/numpy, but must defer the rest until a method needs it
+IMPORT_BENCHMARK_COMPONENT_MODULES = [
+    "src.taxi_demand.components.data_ingestion",
+    "src.taxi_demand.components.data_validation",
+    "src.taxi_demand.components.supply_optimization",
+]
+IMPORT_BENCHMARK_HEAVY_MODULES = ["pandas", "numpy", "sklearn", "scipy", "holidays", "requests", "pymongo"]
+IMPORT_BENCHMARK_COMPONENT_ALLOWED_MODULES = ["pandas", "numpy"]
+IMPORT_BENCHMARK_BUDGET_MS = 150.0
+IMPORT_BENCHMARK_RUNS = 5
+
+# Probes run from the project root so `src` is importable wherever the benchmark is started
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_IMPORT_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed_ms = (time.perf_counter() - start) * 1000\n"
+    "print(elapsed_ms)\n"
+    "print(','.join(sorted({{name.split('.')[0] for name in sys.modules}})))\n"
+)
+
+
+def measure_import(module: str, runs: int = IMPORT_BENCHMARK_RUNS):
+    """
+    Imports `module` in `runs` fresh interpreters.
+
+    Returns:
+        tuple: (median import time in ms, set of top-level packages loaded by the import)
+    """
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE.format(module=module)],
+            capture_output=True, text=True, check=True, cwd=_PROJECT_ROOT
+        )
+        elapsed_ms, modules = result.stdout.strip().splitlines()[-2:]
+        timings.append(float(elapsed_ms))
+        loaded.update(modules.split(","))
+    return statistics.median(timings), loaded
+
+
+def run_import_benchmark(budget_ms: float = IMPORT_BENCHMARK_BUDGET_MS, runs: int = IMPORT_BENCHMARK_RUNS) -> bool:
+    """
+    Checks start-up modules against the import time budget and that no module eagerly loads heavy dependencies.
+
+    Returns:
+        bool: True if every module is within its limits.
+    """
+    passed = True
+    for module in IMPORT_BENCHMARK_STARTUP_MODULES + IMPORT_BENCHMARK_COMPONENT_MODULES:
+        median_ms, loaded = measure_import(module, runs=runs)
+        is_startup = module in IMPORT_BENCHMARK_STARTUP_MODULES
+        allowed = [] if is_startup else IMPORT_BENCHMARK_COMPONENT_ALLOWED_MODULES
+        eager = sorted(set(IMPORT_BENCHMARK_HEAVY_MODULES) - set(allowed) & loaded)
+
+        problems = []
+        if eager:
+            problems.append(f"eagerly imports {', '.join(eager)}")
+        if is_startup and median_ms > budget_ms:
+            problems.append(f"over the {budget_ms:.0f} ms budget")
+        passed = passed and not problems
+        print(f"{'FAIL' if problems else 'ok':<4} {module:<50} {median_ms:8.1f} ms  {'; '.join(problems)}")
+    return passed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from src.taxi_demand.pipeline.training_pipeline import TrainingPipeline
+
+    parser = argparse.ArgumentParser(prog="python -m src.taxi_demand", description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the training pipeline or a single stage")
+    run_parser.add_argument("--stage", choices=TrainingPipeline.STAGES + ["all"], default="all")
+    run_parser.add_argument("--log-dir", default=None, help="Base directory for log files (default: ./project_logs)")
+
+    bench_parser = subparsers.add_parser("bench-import", help="Guard against cold-start import regressions")
+    bench_parser.add_argument("--budget-ms", type=float, default=IMPORT_BENCHMARK_BUDGET_MS)
+    bench_parser.add_argument("--runs", type=int, default=IMPORT_BENCHMARK_RUNS)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.command == "bench-import":
+        return 0 if run_import_benchmark(budget_ms=args.budget_ms, runs=args.runs) else 1
+
+    from src.taxi_demand.logging.logger import logging, setup_logging
+    from src.taxi_demand.pipeline.training_pipeline import TrainingPipeline
+
+    log_file_path = setup_logging(log_dir=args.log_dir)
+    print(f"Logging to {log_file_path}")
+
+    training_pipeline = TrainingPipeline()
+    if args.stage == "all":
+        artifact = training_pipeline.run_pipeline()
+    else:
+        artifact = training_pipeline.run_stage(args.stage)
+    logging.info(f"Finished '{args.stage}': {artifact}")
+    print(artifact)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
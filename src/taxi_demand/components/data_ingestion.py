@@ -1,9 +1,6 @@
 import os
 import sys
 import pandas as pd
-import requests
-from sklearn.model_selection import train_test_split
-import holidays
 
 from src.taxi_demand.exception.exception import TaxiDemandException
 from src.taxi_demand.logging.logger import logging
@@ -20,6 +17,8 @@ class DataIngestion:
 
     def fetch_weather_data(self):
         try:
+            import requests
+
             year = self.data_ingestion_config.data_ingestion_year
             months = sorted(self.data_ingestion_config.data_ingestion_tlc_trip_months)
             month_days = {1:31, 2:28, 3:31, 4:30, 5:31, 6:30,
@@ -58,6 +57,8 @@ class DataIngestion:
 
     def fetch_tlc_trip_data(self):
         try:
+            import requests
+
             base_url = "https://d37ci6vzurychx.cloudfront.net/trip-data"
             feature_store_dir = self.data_ingestion_config.data_ingestion_feature_store_dir
             os.makedirs(feature_store_dir, exist_ok=True)
@@ -150,6 +151,8 @@ class DataIngestion:
         
     def add_date_holiday(self, df):
         try:
+            import holidays
+
             df['date'] = df['pickup_hour'].dt.date
             us_holidays = holidays.US()
             df['is_holiday'] = df['date'].isin(us_holidays).astype(int)
@@ -166,8 +169,24 @@ class DataIngestion:
         except Exception as e:
             raise TaxiDemandException(f"Failed adding rain status feature: {e}", sys)
 
+    def export_features_to_mongodb(self, df):
+        try:
+            from src.taxi_demand.data_access.mongo_store import MongoStore, get_mongo_db_url
+
+            if not get_mongo_db_url():
+                logging.info("MongoDB is not configured, skipping feature export")
+                return 0
+            # Features are recomputed on every run (weather, lags, rolling stats), so replace existing keys
+            written = MongoStore().write_features(df, upsert=True)
+            logging.info(f"Exported {written} feature rows to MongoDB")
+            return written
+        except Exception as e:
+            raise TaxiDemandException(f"Failed exporting features to MongoDB: {e}", sys)
+
     def split_and_save_data(self, df):
         try:
+            from sklearn.model_selection import train_test_split
+
             logging.info("Splitting data into train and test sets")
             train_set, test_set = train_test_split(
                 df,
@@ -213,6 +232,7 @@ class DataIngestion:
             df_with_rolling_stats = self.add_rolling_statistics(df_with_lags)
             df_with_date_holiday = self.add_date_holiday(df_with_rolling_stats)
             df_with_rain_status = self.add_rain_status(df_with_date_holiday)
+            self.export_features_to_mongodb(df_with_rain_status)
             artifact = self.split_and_save_data(df_with_rain_status)
 
             logging.info("Data ingestion workflow completed successfully")
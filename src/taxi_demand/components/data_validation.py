@@ -5,7 +5,6 @@ from src.taxi_demand.logging.logger import logging
 from src.taxi_demand.constants.training_pipeline import SCHEMA_FILE_PATH
 from src.taxi_demand.utils.main_utils.utils import read_yaml_file, write_yaml_file
 
-from scipy.stats import ks_2samp
 import pandas as pd
 import os
 import sys
@@ -39,6 +38,8 @@ class DataValidation:
 
     def detect_dataset_drift(self, base_df, current_df, threshold=0.05) -> bool:
         try:
+            from scipy.stats import ks_2samp
+
             status = True
             report = {}
 
@@ -0,0 +1,334 @@
+import os
+import sys
+import time
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+from src.taxi_demand.exception.exception import TaxiDemandException
+from src.taxi_demand.logging.logger import logging
+from src.taxi_demand.constants.training_pipeline import TARGET_COLUMN
+from src.taxi_demand.entity.config_entity import SupplyOptimizationConfig
+from src.taxi_demand.entity.artifact_entity import SupplyOptimizationArtifact
+
+
+class SupplyOptimization:
+    """
+    Turns per-zone hourly demand forecasts into a vehicle rebalancing plan.
+
+    Vehicles are redistributed so that each zone's supply is proportional to
+    its forecast demand, moving them along the cheapest routes of the zone
+    graph. The zone-to-zone travel cost matrix is built once from historical
+    trips and cached, so each hourly re-plan only has to solve a small sparse
+    transportation problem.
+    """
+    def __init__(self, supply_optimization_config: SupplyOptimizationConfig):
+        try:
+            self.supply_optimization_config = supply_optimization_config
+            self.travel_cost_matrix = None
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def build_travel_cost_matrix(self, trip_files) -> np.ndarray:
+        """
+        Builds the zone-to-zone travel cost matrix (median trip minutes) from TLC trip files.
+
+        Zone pairs with too few direct trips are filled with the shortest path over
+        the observed pairs; pairs that are still unreachable get a penalty cost. Trips
+        to or from the excluded pseudo-zones are dropped, so paths never hop through them.
+        """
+        try:
+            from scipy import sparse
+            from scipy.sparse.csgraph import shortest_path
+
+            num_zones = self.supply_optimization_config.num_zones
+            excluded_zone_ids = self.supply_optimization_config.excluded_zone_ids
+            columns = ['PULocationID', 'DOLocationID', 'tpep_pickup_datetime', 'tpep_dropoff_datetime']
+            df_trips = pd.concat(pd.read_parquet(f, columns=columns) for f in trip_files)
+            logging.info(f"Building travel cost matrix from {len(df_trips)} trips")
+
+            duration = (
+                pd.to_datetime(df_trips['tpep_dropoff_datetime']) - pd.to_datetime(df_trips['tpep_pickup_datetime'])
+            ).dt.total_seconds() / 60.0
+            df_trips = pd.DataFrame({
+                'PULocationID': df_trips['PULocationID'].to_numpy(),
+                'DOLocationID': df_trips['DOLocationID'].to_numpy(),
+                'duration': duration.to_numpy()
+            })
+            df_trips = df_trips[
+                (df_trips['duration'] > 0) & (df_trips['duration'] < 180)
+                & df_trips['PULocationID'].between(1, num_zones)
+                & df_trips['DOLocationID'].between(1, num_zones)
+                & (df_trips['PULocationID'] != df_trips['DOLocationID'])
+                & ~df_trips['PULocationID'].isin(excluded_zone_ids)
+                & ~df_trips['DOLocationID'].isin(excluded_zone_ids)
+            ]
+
+            pair_stats = df_trips.groupby(['PULocationID', 'DOLocationID'])['duration'].agg(['median', 'size']).reset_index()
+            pair_stats = pair_stats[pair_stats['size'] >= self.supply_optimization_config.min_trips_per_pair]
+
+            graph = sparse.csr_matrix(
+                (pair_stats['median'].to_numpy(),
+                 (pair_stats['PULocationID'].to_numpy() - 1, pair_stats['DOLocationID'].to_numpy() - 1)),
+                shape=(num_zones, num_zones)
+            )
+            travel_cost = shortest_path(graph, method='D', directed=True)
+
+            reachable = np.isfinite(travel_cost)
+            max_cost = travel_cost[reachable].max() if reachable.any() else 1.0
+            travel_cost[~reachable] = max_cost * self.supply_optimization_config.unreachable_cost_multiplier
+            np.fill_diagonal(travel_cost, 0.0)
+
+            logging.info(f"Travel cost matrix built with {len(pair_stats)} observed zone pairs, "
+                         f"{int((~reachable).sum())} unreachable pairs penalized")
+            self.travel_cost_matrix = travel_cost
+            return travel_cost
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def save_travel_cost_matrix(self) -> str:
+        try:
+            file_path = self.supply_optimization_config.travel_cost_matrix_file_path
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            np.save(file_path, self.travel_cost_matrix)
+            logging.info(f"Travel cost matrix saved to {file_path}")
+            return file_path
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def load_travel_cost_matrix(self) -> np.ndarray:
+        try:
+            file_path = self.supply_optimization_config.travel_cost_matrix_file_path
+            self.travel_cost_matrix = np.load(file_path)
+            logging.info(f"Travel cost matrix loaded from {file_path}")
+            return self.travel_cost_matrix
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    @staticmethod
+    def compute_target_supply(forecast_demand: np.ndarray, total_vehicles: int) -> Optional[np.ndarray]:
+        """
+        Splits the fleet across zones in proportion to forecast demand (largest remainder rounding).
+
+        Returns None when there is no positive forecast demand, since there is nothing to rebalance towards.
+        """
+        demand = np.clip(np.nan_to_num(forecast_demand.astype(float)), 0.0, None)
+        if demand.sum() <= 0:
+            return None
+        quota = demand / demand.sum() * total_vehicles
+        target = np.floor(quota).astype(np.int64)
+        remainder = int(total_vehicles - target.sum())
+        if remainder > 0:
+            target[np.argsort(target - quota)[:remainder]] += 1
+        return target
+
+    @staticmethod
+    def solve_min_cost_flow(cost: np.ndarray, surplus: np.ndarray, deficit: np.ndarray,
+                            candidate_neighbors: int, max_pricing_rounds: int):
+        """
+        Solves the balanced transportation LP between surplus and deficit zones with HiGHS.
+
+        Since `cost` already holds shortest-path costs over the zone graph, this is
+        equivalent to min-cost flow on the graph itself. Only a sparse set of candidate
+        arcs is handed to the solver: each zone's nearest counterparts plus the greedy
+        plan's arcs (which keeps the restricted problem feasible). Arcs with negative
+        reduced cost under the solver's duals are then added back until none are left,
+        so the result is optimal over all arcs. Returns the (n_surplus, n_deficit) flow
+        matrix, or None if the solver did not reach an optimum.
+        """
+        from scipy import sparse
+        from scipy.optimize import linprog
+
+        n_src, n_dst = cost.shape
+        b_eq = np.concatenate([surplus, deficit]).astype(float)
+
+        k_dst = min(candidate_neighbors, n_dst)
+        k_src = min(candidate_neighbors, n_src)
+        candidates = np.zeros(cost.shape, dtype=bool)
+        candidates[np.arange(n_src)[:, None], np.argpartition(cost, k_dst - 1, axis=1)[:, :k_dst]] = True
+        candidates[np.argpartition(cost, k_src - 1, axis=0)[:k_src, :], np.arange(n_dst)[None, :]] = True
+        candidates |= SupplyOptimization.solve_greedy(cost, surplus, deficit) > 0
+
+        for _ in range(max_pricing_rounds):
+            src_idx, dst_idx = np.nonzero(candidates)
+            n_arcs = len(src_idx)
+            a_eq = sparse.csr_matrix(
+                (np.ones(2 * n_arcs), (np.concatenate([src_idx, n_src + dst_idx]), np.tile(np.arange(n_arcs), 2))),
+                shape=(n_src + n_dst, n_arcs)
+            )
+            result = linprog(cost[src_idx, dst_idx], A_eq=a_eq, b_eq=b_eq, bounds=(0, None),
+                             method='highs-ds', options={'presolve': False})
+            if result.status != 0:
+                logging.warning(f"Min-cost flow solver failed: {result.message}")
+                return None
+
+            duals = result.eqlin.marginals
+            reduced_cost = cost - duals[:n_src, None] - duals[None, n_src:]
+            entering = (reduced_cost < -1e-9) & ~candidates
+            if not entering.any():
+                flows = np.zeros(cost.shape, dtype=np.int64)
+                flows[src_idx, dst_idx] = np.rint(result.x).astype(np.int64)
+                return flows
+            candidates |= entering
+
+        logging.warning("Min-cost flow pricing did not converge")
+        return None
+
+    @staticmethod
+    def solve_greedy(cost: np.ndarray, surplus: np.ndarray, deficit: np.ndarray) -> np.ndarray:
+        """
+        Vectorized greedy fallback: in each round every unmet deficit zone claims its
+        cheapest surplus zone that still has vehicles, and each surplus zone serves its
+        claims cheapest first. Every round exhausts at least one zone.
+        """
+        remaining_src = surplus.astype(np.int64).copy()
+        remaining_dst = deficit.astype(np.int64).copy()
+        flows = np.zeros(cost.shape, dtype=np.int64)
+
+        while remaining_dst.sum() > 0 and remaining_src.sum() > 0:
+            active = np.flatnonzero(remaining_dst > 0)
+            available = np.where(remaining_src[:, None] > 0, cost[:, active], np.inf)
+            src = available.argmin(axis=0)
+            claim_cost = available[src, np.arange(len(active))]
+
+            order = np.lexsort((claim_cost, src))
+            src, active = src[order], active[order]
+            want = remaining_dst[active]
+
+            # Vehicles already promised to earlier (cheaper) claims on the same source
+            claimed_before = np.cumsum(want) - want
+            group_start = np.r_[True, src[1:] != src[:-1]]
+            claimed_before -= np.maximum.accumulate(np.where(group_start, claimed_before, 0))
+            grant = np.clip(remaining_src[src] - claimed_before, 0, want)
+
+            flows[src, active] += grant
+            remaining_dst[active] -= grant
+            np.subtract.at(remaining_src, src, grant)
+
+        return flows
+
+    def zone_totals(self, zone_ids: pd.Series, weights: np.ndarray, name: str) -> np.ndarray:
+        """
+        Sums `weights` per zone into an array indexed by zone id - 1.
+
+        Raises:
+            ValueError: If any zone id is outside 1..num_zones.
+        """
+        num_zones = self.supply_optimization_config.num_zones
+        zone_ids = zone_ids.to_numpy().astype(np.int64)
+        out_of_range = (zone_ids < 1) | (zone_ids > num_zones)
+        if out_of_range.any():
+            raise ValueError(f"{name} has zone ids outside 1..{num_zones}: {sorted(set(zone_ids[out_of_range].tolist()))}")
+        return np.bincount(zone_ids - 1, weights=weights, minlength=num_zones)
+
+    def plan_rebalancing(self, forecast_df: pd.DataFrame, vehicles_df: pd.DataFrame):
+        """
+        Computes the minimum-cost rebalancing plan for the next hour.
+
+        Args:
+            forecast_df (pd.DataFrame): Forecast per zone, with 'PULocationID' and TARGET_COLUMN.
+            vehicles_df (pd.DataFrame): Current vehicle positions, with 'PULocationID' and
+                'vehicle_count' (one row per zone, or one row per vehicle without the count).
+
+        Returns:
+            tuple: (plan DataFrame with from/to zone, vehicles and travel cost, solver used)
+        """
+        try:
+            start = time.perf_counter()
+            if self.travel_cost_matrix is None:
+                self.load_travel_cost_matrix()
+
+            demand = self.zone_totals(forecast_df['PULocationID'],
+                                      forecast_df[TARGET_COLUMN].to_numpy(dtype=float), 'forecast_df')
+            vehicle_weights = vehicles_df['vehicle_count'].to_numpy(dtype=float) if 'vehicle_count' in vehicles_df else None
+            supply = np.rint(self.zone_totals(vehicles_df['PULocationID'], vehicle_weights, 'vehicles_df')).astype(np.int64)
+
+            # Pseudo-zones get no share of the fleet, and vehicles reported there cannot be dispatched
+            excluded_idx = np.asarray(self.supply_optimization_config.excluded_zone_ids, dtype=np.int64) - 1
+            demand[excluded_idx] = 0.0
+            if supply[excluded_idx].any():
+                logging.info(f"Leaving {int(supply[excluded_idx].sum())} vehicles in excluded zones out of the plan")
+                supply[excluded_idx] = 0
+
+            plan_columns = ['from_zone', 'to_zone', 'vehicles', 'travel_cost']
+            if supply.sum() == 0:
+                logging.info("No vehicles available, nothing to rebalance")
+                return pd.DataFrame(columns=plan_columns), 'none'
+
+            target = self.compute_target_supply(demand, int(supply.sum()))
+            if target is None:
+                logging.info("No forecast demand, keeping current vehicle positions")
+                return pd.DataFrame(columns=plan_columns), 'none'
+
+            imbalance = supply - target
+            src_zones = np.flatnonzero(imbalance > 0)
+            dst_zones = np.flatnonzero(imbalance < 0)
+            if len(src_zones) == 0:
+                return pd.DataFrame(columns=plan_columns), 'none'
+
+            cost = self.travel_cost_matrix[np.ix_(src_zones, dst_zones)]
+            surplus = imbalance[src_zones]
+            deficit = -imbalance[dst_zones]
+
+            flows = None
+            solver = self.supply_optimization_config.solver
+            if solver == 'lp':
+                flows = self.solve_min_cost_flow(
+                    cost, surplus, deficit,
+                    candidate_neighbors=self.supply_optimization_config.candidate_neighbors,
+                    max_pricing_rounds=self.supply_optimization_config.max_pricing_rounds
+                )
+            if flows is None:
+                if solver == 'lp':
+                    logging.warning("Falling back to greedy rebalancing")
+                solver = 'greedy'
+                flows = self.solve_greedy(cost, surplus, deficit)
+
+            src_idx, dst_idx = np.nonzero(flows)
+            plan_df = pd.DataFrame({
+                'from_zone': src_zones[src_idx] + 1,
+                'to_zone': dst_zones[dst_idx] + 1,
+                'vehicles': flows[src_idx, dst_idx],
+                'travel_cost': cost[src_idx, dst_idx]
+            })
+
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logging.info(f"Rebalancing plan ({solver}) moves {int(plan_df['vehicles'].sum())} vehicles "
+                         f"over {len(plan_df)} routes in {elapsed_ms:.1f} ms")
+            return plan_df, solver
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def initiate_travel_cost_matrix(self, trip_files) -> str:
+        """
+        Precomputes the travel cost matrix from historical trips and saves it for plan_rebalancing to load.
+        """
+        try:
+            self.build_travel_cost_matrix(trip_files)
+            return self.save_travel_cost_matrix()
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def initiate_supply_optimization(self, trip_files, forecast_df: pd.DataFrame,
+                                     vehicles_df: pd.DataFrame) -> SupplyOptimizationArtifact:
+        try:
+            logging.info("Starting supply optimization workflow")
+            travel_cost_matrix_file_path = self.initiate_travel_cost_matrix(trip_files)
+
+            plan_df, solver = self.plan_rebalancing(forecast_df, vehicles_df)
+            plan_file_path = self.supply_optimization_config.rebalancing_plan_file_path
+            os.makedirs(os.path.dirname(plan_file_path), exist_ok=True)
+            plan_df.to_csv(plan_file_path, index=False)
+            logging.info(f"Rebalancing plan saved to {plan_file_path}")
+
+            supply_optimization_artifact = SupplyOptimizationArtifact(
+                travel_cost_matrix_file_path=travel_cost_matrix_file_path,
+                rebalancing_plan_file_path=plan_file_path,
+                total_vehicles_moved=int(plan_df['vehicles'].sum()),
+                total_rebalancing_cost=float((plan_df['vehicles'] * plan_df['travel_cost']).sum()),
+                solver=solver
+            )
+            logging.info("Supply optimization workflow completed successfully")
+            return supply_optimization_artifact
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
@@ -67,3 +67,47 @@ DATA_VALIDATION_VALID_DIR: str = "validated"
 DATA_VALIDATION_INVALID_DIR: str = "invalid"
 DATA_VALIDATION_DRIFT_REPORT_DIR: str = "drift_report"
 DATA_VALIDATION_DRIFT_REPORT_FILE_NAME: str = "report.yaml"
+
+
+"""
+Supply Optimization related constants start with SUPPLY_OPTIMIZATION VAR NAME
+"""
+
+SUPPLY_OPTIMIZATION_DIR_NAME: str = "supply_optimization"
+SUPPLY_OPTIMIZATION_TRAVEL_COST_FILE_NAME: str = "travel_cost_matrix.npy"
+SUPPLY_OPTIMIZATION_PLAN_FILE_NAME: str = "rebalancing_plan.csv"
+
+# TLC taxi zone ids run from 1 to 265 (264/265 are the "unknown" zones)
+SUPPLY_OPTIMIZATION_NUM_ZONES: int = 265
+# "Unknown" and "Outside of NYC" are not places vehicles can be routed through or sent to
+SUPPLY_OPTIMIZATION_EXCLUDED_ZONE_IDS: List[int] = [264, 265]
+
+# Travel cost is the median trip duration in minutes between two zones
+SUPPLY_OPTIMIZATION_MIN_TRIPS_PER_PAIR: int = 5
+SUPPLY_OPTIMIZATION_UNREACHABLE_COST_MULTIPLIER: float = 2.0
+
+# "lp" solves the sparse min-cost-flow LP and falls back to "greedy" on failure
+SUPPLY_OPTIMIZATION_SOLVER: str = "lp"
+
+# Sparse LP: each zone starts with arcs to its nearest counterparts, more are priced in as needed
+SUPPLY_OPTIMIZATION_CANDIDATE_NEIGHBORS: int = 8
+SUPPLY_OPTIMIZATION_MAX_PRICING_ROUNDS: int = 10
+
+
+"""
+MongoDB related constants start with MONGO VAR NAME
+"""
+
+# Connection string is read from the environment (or a .env file), never hard-coded
+MONGO_DB_URL_ENV_KEY: str = "MONGO_DB_URL"
+MONGO_DATABASE_NAME: str = "taxi_demand"
+MONGO_FEATURE_COLLECTION_NAME: str = "zone_hourly_features"
+MONGO_FORECAST_COLLECTION_NAME: str = "zone_hourly_forecasts"
+
+# Documents are keyed and indexed by pickup zone and hour
+MONGO_INDEX_KEYS: List[str] = ["PULocationID", "pickup_hour"]
+
+MONGO_MAX_POOL_SIZE: int = 16
+MONGO_WRITE_BATCH_SIZE: int = 10000
+MONGO_WRITE_WORKERS: int = 4
+MONGO_READ_BATCH_SIZE: int = 50000
@@ -0,0 +1,233 @@
+import os
+import sys
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pymongo
+from pymongo import ReplaceOne
+from pymongo.errors import BulkWriteError
+from dotenv import load_dotenv
+
+from src.taxi_demand.exception.exception import TaxiDemandException
+from src.taxi_demand.logging.logger import logging
+from src.taxi_demand.constants import training_pipeline
+
+
+_client = None
+_client_url = None
+_client_lock = threading.Lock()
+
+
+def get_mongo_db_url():
+    """
+    Returns the MongoDB connection string from the environment (or a .env file), or None if unset.
+    """
+    load_dotenv()
+    return os.getenv(training_pipeline.MONGO_DB_URL_ENV_KEY)
+
+
+def get_mongo_client(mongo_db_url: str = None) -> pymongo.MongoClient:
+    """
+    Returns the process-wide MongoClient, creating it on first use.
+
+    MongoClient is thread-safe and keeps its own connection pool, so every
+    reader and writer shares this one instance instead of opening new sockets.
+    Datetimes are read back naive, exactly as `MongoStore` writes them.
+
+    Raises:
+        TaxiDemandException: If no connection string is configured, or if `mongo_db_url`
+            differs from the URL of the existing shared client.
+    """
+    global _client, _client_url
+    try:
+        with _client_lock:
+            if _client is None:
+                _client_url = mongo_db_url or get_mongo_db_url()
+                if not _client_url:
+                    raise ValueError(f"{training_pipeline.MONGO_DB_URL_ENV_KEY} is not set")
+                _client = pymongo.MongoClient(_client_url, maxPoolSize=training_pipeline.MONGO_MAX_POOL_SIZE)
+                logging.info("Created shared MongoDB client")
+            elif mongo_db_url and mongo_db_url != _client_url:
+                raise ValueError("The shared MongoDB client is already connected to a different URL; "
+                                 "call close_mongo_client() first")
+        return _client
+    except Exception as e:
+        raise TaxiDemandException(e, sys) from e
+
+
+def close_mongo_client() -> None:
+    global _client, _client_url
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+            _client_url = None
+            logging.info("Closed shared MongoDB client")
+
+
+class MongoStore:
+    """
+    Bulk persistence of zone-hourly features and forecasts in MongoDB.
+
+    Writes are split into batches and sent concurrently over the pooled client,
+    either as unordered `insert_many` calls or as unordered bulk upserts keyed on
+    (PULocationID, pickup_hour), which a unique index enforces. Reads stream the
+    collection back as DataFrame chunks. Any pymongo-compatible client (e.g.
+    `mongomock.MongoClient()`) can be passed in place of the shared one.
+    """
+    def __init__(self, client=None, database_name: str = training_pipeline.MONGO_DATABASE_NAME):
+        try:
+            self.client = client if client is not None else get_mongo_client()
+            self.database = self.client[database_name]
+            self.index_keys = training_pipeline.MONGO_INDEX_KEYS
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def ensure_indexes(self, collection_name: str) -> str:
+        try:
+            index_name = self.database[collection_name].create_index(
+                [(key, pymongo.ASCENDING) for key in self.index_keys], unique=True
+            )
+            logging.info(f"Ensured index '{index_name}' on collection '{collection_name}'")
+            return index_name
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    @staticmethod
+    def dataframe_to_documents(dataframe: pd.DataFrame) -> list:
+        """
+        Converts a DataFrame to BSON-encodable documents column by column.
+
+        Timestamps become naive UTC `datetime` values (BSON dates have millisecond precision),
+        and `datetime.date` values such as the 'date' feature, which BSON cannot encode, become ISO strings.
+        Missing values in nullable extension columns (`pd.NA`) become None.
+        This avoids the per-cell Timestamp boxing of `to_dict(orient='records')`.
+        """
+        try:
+            keys = list(dataframe.columns)
+            columns = []
+            for key in keys:
+                series = dataframe[key]
+                if isinstance(series.dtype, pd.DatetimeTZDtype):
+                    series = series.dt.tz_convert('UTC').dt.tz_localize(None)
+                if pd.api.types.is_datetime64_dtype(series.dtype):
+                    columns.append(series.to_numpy().astype('datetime64[ms]').tolist())
+                    continue
+                if isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+                    series = series.astype(object).where(series.notna(), None)
+                values = series.tolist()
+                first_valid = next((value for value in values if value is not None and value == value), None)
+                if isinstance(first_valid, datetime.date) and not isinstance(first_valid, datetime.datetime):
+                    values = [value.isoformat() if isinstance(value, datetime.date) else value for value in values]
+                columns.append(values)
+            return [dict(zip(keys, row)) for row in zip(*columns)]
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def _insert_batch(self, collection_name: str, documents: list) -> int:
+        try:
+            result = self.database[collection_name].insert_many(documents, ordered=False)
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Unordered inserts keep going past duplicate keys; only those are safe to skip
+            write_errors = e.details.get('writeErrors', [])
+            if e.details.get('writeConcernErrors') or any(error['code'] != 11000 for error in write_errors):
+                raise
+            logging.warning(f"Skipped {len(write_errors)} documents whose key already exists in "
+                            f"'{collection_name}'; write them with upsert=True to replace them")
+            return e.details['nInserted']
+
+    def _upsert_batch(self, collection_name: str, documents: list) -> int:
+        operations = [
+            ReplaceOne({key: document[key] for key in self.index_keys}, document, upsert=True)
+            for document in documents
+        ]
+        result = self.database[collection_name].bulk_write(operations, ordered=False)
+        return result.upserted_count + result.matched_count
+
+    def write_dataframe(self, dataframe: pd.DataFrame, collection_name: str, upsert: bool = False,
+                        batch_size: int = training_pipeline.MONGO_WRITE_BATCH_SIZE,
+                        max_workers: int = training_pipeline.MONGO_WRITE_WORKERS) -> int:
+        """
+        Writes a DataFrame to a collection in concurrent unordered batches.
+
+        Args:
+            dataframe (pd.DataFrame): Rows to write, one document per row.
+            collection_name (str): Target collection.
+            upsert (bool): Replace documents matching (PULocationID, pickup_hour) instead of inserting.
+                Inserting is much faster; rows whose key already exists are skipped with a warning.
+                Upserting keeps the last row per key, so concurrent batches never share a key.
+            batch_size (int): Documents per insert_many/bulk_write call.
+            max_workers (int): Batches in flight at once over the pooled client.
+
+        Returns:
+            int: Number of documents inserted or upserted.
+        """
+        try:
+            if upsert:
+                dataframe = dataframe.drop_duplicates(subset=self.index_keys, keep='last')
+            documents = self.dataframe_to_documents(dataframe)
+            if not documents:
+                return 0
+            self.ensure_indexes(collection_name)
+
+            write_batch = self._upsert_batch if upsert else self._insert_batch
+            batches = [documents[i:i + batch_size] for i in range(0, len(documents), batch_size)]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                written = sum(executor.map(lambda batch: write_batch(collection_name, batch), batches))
+
+            logging.info(f"Wrote {written} documents to '{collection_name}' in {len(batches)} batches "
+                         f"({'upsert' if upsert else 'insert'})")
+            return written
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def write_features(self, dataframe: pd.DataFrame, upsert: bool = False) -> int:
+        return self.write_dataframe(dataframe, training_pipeline.MONGO_FEATURE_COLLECTION_NAME, upsert=upsert)
+
+    def write_forecasts(self, dataframe: pd.DataFrame, upsert: bool = False) -> int:
+        return self.write_dataframe(dataframe, training_pipeline.MONGO_FORECAST_COLLECTION_NAME, upsert=upsert)
+
+    @staticmethod
+    def documents_to_dataframe(documents: list, timezone: str = None) -> pd.DataFrame:
+        dataframe = pd.DataFrame(documents)
+        if timezone:
+            for column in dataframe.columns:
+                if pd.api.types.is_datetime64_dtype(dataframe[column].dtype):
+                    dataframe[column] = dataframe[column].dt.tz_localize('UTC').dt.tz_convert(timezone)
+        return dataframe
+
+    def stream_dataframes(self, collection_name: str, query: dict = None, projection: dict = None,
+                          batch_size: int = training_pipeline.MONGO_READ_BATCH_SIZE, timezone: str = None):
+        """
+        Streams a collection as DataFrame chunks of up to `batch_size` rows, without the '_id' field.
+
+        The cursor fetches `batch_size` documents per round trip, so memory stays bounded by one chunk.
+        Datetime columns come back naive, as stored: naive columns round-trip unchanged, while
+        tz-aware columns were stored in UTC. Pass `timezone` (e.g. 'America/New_York') to get
+        those back as tz-aware columns in that zone.
+        """
+        try:
+            projection = {'_id': 0, **(projection or {})}
+            cursor = self.database[collection_name].find(query or {}, projection, batch_size=batch_size)
+            chunk = []
+            for document in cursor:
+                chunk.append(document)
+                if len(chunk) == batch_size:
+                    yield self.documents_to_dataframe(chunk, timezone=timezone)
+                    chunk = []
+            if chunk:
+                yield self.documents_to_dataframe(chunk, timezone=timezone)
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def read_dataframe(self, collection_name: str, query: dict = None, projection: dict = None,
+                       timezone: str = None) -> pd.DataFrame:
+        try:
+            chunks = list(self.stream_dataframes(collection_name, query=query, projection=projection,
+                                                 timezone=timezone))
+            return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
@@ -12,4 +12,12 @@ class DataValidationArtifact:
     valid_test_file_path: str
     invalid_train_file_path: str
     invalid_test_file_path: str
-    drift_report_file_path: str
\ No newline at end of file
+    drift_report_file_path: str
+
+@dataclass
+class SupplyOptimizationArtifact:
+    travel_cost_matrix_file_path: str
+    rebalancing_plan_file_path: str
+    total_vehicles_moved: int
+    total_rebalancing_cost: float
+    solver: str
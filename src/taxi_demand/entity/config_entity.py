@@ -4,9 +4,6 @@ import os
 from src.taxi_demand.constants import training_pipeline
 
 
-print(training_pipeline.PIPELINE_NAME)
-print(training_pipeline.ARTIFACT_DIR)
-
 class TrainingPipelineConfig:
     def __init__(self):
         self.pipeline_name = training_pipeline.PIPELINE_NAME
@@ -83,4 +80,26 @@ class DataValidationConfig:
             self.data_validation_dir,
             training_pipeline.DATA_VALIDATION_DRIFT_REPORT_DIR,
             training_pipeline.DATA_VALIDATION_DRIFT_REPORT_FILE_NAME
-        )
\ No newline at end of file
+        )
+
+
+class SupplyOptimizationConfig:
+    def __init__(self, training_pipeline_config: TrainingPipelineConfig):
+        self.supply_optimization_dir = os.path.join(training_pipeline_config.artifact_dir,
+            training_pipeline.SUPPLY_OPTIMIZATION_DIR_NAME
+        )
+        self.travel_cost_matrix_file_path = os.path.join(
+            self.supply_optimization_dir,
+            training_pipeline.SUPPLY_OPTIMIZATION_TRAVEL_COST_FILE_NAME
+        )
+        self.rebalancing_plan_file_path = os.path.join(
+            self.supply_optimization_dir,
+            training_pipeline.SUPPLY_OPTIMIZATION_PLAN_FILE_NAME
+        )
+        self.num_zones = training_pipeline.SUPPLY_OPTIMIZATION_NUM_ZONES
+        self.excluded_zone_ids = training_pipeline.SUPPLY_OPTIMIZATION_EXCLUDED_ZONE_IDS
+        self.min_trips_per_pair = training_pipeline.SUPPLY_OPTIMIZATION_MIN_TRIPS_PER_PAIR
+        self.unreachable_cost_multiplier = training_pipeline.SUPPLY_OPTIMIZATION_UNREACHABLE_COST_MULTIPLIER
+        self.solver = training_pipeline.SUPPLY_OPTIMIZATION_SOLVER
+        self.candidate_neighbors = training_pipeline.SUPPLY_OPTIMIZATION_CANDIDATE_NEIGHBORS
+        self.max_pricing_rounds = training_pipeline.SUPPLY_OPTIMIZATION_MAX_PRICING_ROUNDS
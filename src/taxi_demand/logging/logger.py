@@ -1,16 +1,81 @@
+"""
+Importing this module has no side effects: nothing is written until setup_logging() is called.
+
+Log records are put on an in-memory queue by a QueueHandler and written to the log
+file by a background QueueListener, so logging calls never block on disk I/O.
+"""
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
 
-LOG_FILE = f"{datetime.now().strftime('%m-%d-%Y-%H-%M-%S')}.log"
+LOG_DIR_NAME = "project_logs"
+LOG_FORMAT = "[%(asctime)s] %(lineno)d - %(name)s - %(levelname)s - %(message)s"
+
+LOG_FILE_PATH = None
+
+_listener = None
+_queue_handler = None
+_setup_lock = threading.Lock()
+
+
+def setup_logging(log_dir: str = None, level: int = logging.INFO) -> str:
+    """
+    Configures the root logger to write to a timestamped file under `log_dir` through a queue.
+
+    Any handlers already on the root logger are removed, including the stderr handler that
+    the standard library's `logging.info()` installs when it runs before any setup, so
+    records are not written twice. Calling it again is a no-op and returns the existing
+    log file path.
+
+    Args:
+        log_dir (str): Base directory for log files. Defaults to ./project_logs.
+        level (int): Root logger level.
+
+    Returns:
+        str: The path of the log file.
+    """
+    global LOG_FILE_PATH, _listener, _queue_handler
+    with _setup_lock:
+        if _listener is not None:
+            return LOG_FILE_PATH
+
+        log_file = f"{datetime.now().strftime('%m-%d-%Y-%H-%M-%S')}.log"
+        logs_path = os.path.join(log_dir or os.path.join(os.getcwd(), LOG_DIR_NAME), log_file)
+        os.makedirs(logs_path, exist_ok=True)
+        LOG_FILE_PATH = os.path.join(logs_path, log_file)
+
+        file_handler = logging.FileHandler(LOG_FILE_PATH)
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        log_queue = queue.SimpleQueue()
+        _queue_handler = logging.handlers.QueueHandler(log_queue)
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+            handler.close()
+        root_logger.addHandler(_queue_handler)
+        root_logger.setLevel(level)
 
-logs_path = os.path.join(os.getcwd(), "project_logs", LOG_FILE)
-os.makedirs(logs_path, exist_ok = True)
+        _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return LOG_FILE_PATH
 
-LOG_FILE_PATH = os.path.join(logs_path, LOG_FILE)
 
-logging.basicConfig(
-    filename = LOG_FILE_PATH,
-    format = "[%(asctime)s] %(lineno)d - %(name)s - %(levelname)s - %(message)s",
-    level = logging.INFO
-)
\ No newline at end of file
+def shutdown_logging() -> None:
+    """
+    Flushes queued records to the log file and stops the background listener.
+    """
+    global _listener, _queue_handler
+    with _setup_lock:
+        if _listener is not None:
+            logging.getLogger().removeHandler(_queue_handler)
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+            _queue_handler = None
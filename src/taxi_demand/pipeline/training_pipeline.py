@@ -0,0 +1,112 @@
+import os
+import sys
+
+from src.taxi_demand.exception.exception import TaxiDemandException
+from src.taxi_demand.logging.logger import logging
+from src.taxi_demand.entity.config_entity import (TrainingPipelineConfig, DataIngestionConfig, DataValidationConfig,
+                                                  SupplyOptimizationConfig)
+from src.taxi_demand.entity.artifact_entity import DataIngestionArtifact, DataValidationArtifact
+
+
+class TrainingPipeline:
+    """
+    Runs the training pipeline stages, either end to end or one at a time.
+
+    Components are imported inside each stage so that importing the pipeline
+    (e.g. from the CLI) does not pull in pandas, sklearn or scipy.
+    """
+    STAGES = ["data_ingestion", "data_validation", "supply_optimization"]
+
+    def __init__(self):
+        try:
+            self.training_pipeline_config = TrainingPipelineConfig()
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def start_data_ingestion(self) -> DataIngestionArtifact:
+        try:
+            from src.taxi_demand.components.data_ingestion import DataIngestion
+
+            data_ingestion_config = DataIngestionConfig(training_pipeline_config=self.training_pipeline_config)
+            data_ingestion = DataIngestion(data_ingestion_config=data_ingestion_config)
+            logging.info("Initiating Data Ingestion")
+            data_ingestion_artifact = data_ingestion.initiate_data_ingestion()
+            logging.info("Data Ingestion completed.")
+            return data_ingestion_artifact
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def start_data_validation(self, data_ingestion_artifact: DataIngestionArtifact = None) -> DataValidationArtifact:
+        """
+        Runs data validation. Without an artifact, the train/test files of a previous ingestion run are used.
+        """
+        try:
+            from src.taxi_demand.components.data_validation import DataValidation
+
+            if data_ingestion_artifact is None:
+                data_ingestion_config = DataIngestionConfig(training_pipeline_config=self.training_pipeline_config)
+                data_ingestion_artifact = DataIngestionArtifact(
+                    train_file_path=data_ingestion_config.training_file_path,
+                    test_file_path=data_ingestion_config.testing_file_path
+                )
+
+            data_validation_config = DataValidationConfig(training_pipeline_config=self.training_pipeline_config)
+            data_validation = DataValidation(data_ingestion_artifact=data_ingestion_artifact,
+                                             data_validation_config=data_validation_config)
+            logging.info("Initiating Data Validation")
+            data_validation_artifact = data_validation.initiate_data_validation()
+            logging.info("Data Validation completed.")
+            return data_validation_artifact
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def start_supply_optimization(self) -> str:
+        """
+        Precomputes the zone travel cost matrix from the TLC trip files downloaded by data ingestion.
+
+        Returns:
+            str: Path of the saved matrix, which SupplyOptimization.plan_rebalancing loads when serving.
+        """
+        try:
+            from src.taxi_demand.components.supply_optimization import SupplyOptimization
+
+            data_ingestion_config = DataIngestionConfig(training_pipeline_config=self.training_pipeline_config)
+            trip_files = [
+                os.path.join(
+                    data_ingestion_config.data_ingestion_feature_store_dir,
+                    data_ingestion_config.data_ingestion_tlc_trip_file_template.format(
+                        year=data_ingestion_config.data_ingestion_year, month=month
+                    )
+                )
+                for month in data_ingestion_config.data_ingestion_tlc_trip_months
+            ]
+
+            supply_optimization_config = SupplyOptimizationConfig(training_pipeline_config=self.training_pipeline_config)
+            supply_optimization = SupplyOptimization(supply_optimization_config=supply_optimization_config)
+            logging.info("Initiating Supply Optimization")
+            travel_cost_matrix_file_path = supply_optimization.initiate_travel_cost_matrix(trip_files)
+            logging.info("Supply Optimization completed.")
+            return travel_cost_matrix_file_path
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def run_stage(self, stage: str):
+        try:
+            if stage == "data_ingestion":
+                return self.start_data_ingestion()
+            if stage == "data_validation":
+                return self.start_data_validation()
+            if stage == "supply_optimization":
+                return self.start_supply_optimization()
+            raise ValueError(f"Unknown stage '{stage}', expected one of {self.STAGES}")
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
+
+    def run_pipeline(self) -> DataValidationArtifact:
+        try:
+            data_ingestion_artifact = self.start_data_ingestion()
+            data_validation_artifact = self.start_data_validation(data_ingestion_artifact=data_ingestion_artifact)
+            self.start_supply_optimization()
+            return data_validation_artifact
+        except Exception as e:
+            raise TaxiDemandException(e, sys) from e
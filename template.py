@@ -37,7 +37,8 @@ list_of_files = [
     f"src/{project_name}/logging/logger.py",
     f"src/{project_name}/constants/__init__.py",
     f"src/{project_name}/constants/training_pipeline/__init__.py",
-    "main.py",
+    f"src/{project_name}/cli.py",
+    f"src/{project_name}/__main__.py",
     "Dockerfile",
     ".gitignore",
     '.dockerignore',
@@ -0,0 +1,6 @@
+from src.taxi_demand.cli import run_import_benchmark
+
+
+def test_cold_start_imports_stay_light():
+    # Fails if a start-up module exceeds the import budget or any module eagerly imports heavy dependencies
+    assert run_import_benchmark(runs=3)
@@ -0,0 +1,80 @@
+import mongomock
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.taxi_demand.data_access.mongo_store import MongoStore
+
+COLLECTION = "zone_hourly_features"
+
+
+@pytest.fixture
+def store():
+    return MongoStore(client=mongomock.MongoClient())
+
+
+@pytest.fixture
+def features():
+    pickup_hours = pd.date_range("2025-01-01", periods=24, freq="h")
+    return pd.DataFrame({
+        "pickup_hour": np.tile(pickup_hours, 10),
+        "PULocationID": np.repeat(np.arange(1, 11), 24),
+        "ride_count": np.arange(240),
+        "temperature_2m": np.linspace(-5.0, 5.0, 240),
+    })
+
+
+def test_insert_round_trip_keeps_dtypes(store, features):
+    assert store.write_dataframe(features, COLLECTION, batch_size=50) == len(features)
+
+    out = store.read_dataframe(COLLECTION)
+    assert out["pickup_hour"].dtype == features["pickup_hour"].dtype
+    merged = out.merge(features, on=["PULocationID", "pickup_hour"], suffixes=("", "_expected"))
+    assert len(merged) == len(features)
+    assert (merged["ride_count"] == merged["ride_count_expected"]).all()
+
+
+def test_unique_index_and_duplicate_insert_is_skipped(store, features):
+    store.write_dataframe(features, COLLECTION)
+    assert store.write_dataframe(features.head(30), COLLECTION) == 0
+    assert store.database[COLLECTION].count_documents({}) == len(features)
+
+    index = store.database[COLLECTION].index_information()["PULocationID_1_pickup_hour_1"]
+    assert index.get("unique") is True
+
+
+def test_upsert_replaces_and_keeps_last_row_per_key(store, features):
+    store.write_dataframe(features, COLLECTION)
+    corrections = pd.concat([features.head(5).assign(ride_count=-1), features.head(5).assign(ride_count=999)])
+
+    assert store.write_dataframe(corrections, COLLECTION, upsert=True, batch_size=5) == 5
+    assert store.database[COLLECTION].count_documents({}) == len(features)
+    assert store.database[COLLECTION].count_documents({"ride_count": 999}) == 5
+
+
+def test_stream_dataframes_yields_bounded_chunks(store, features):
+    store.write_dataframe(features, COLLECTION)
+    chunks = list(store.stream_dataframes(COLLECTION, batch_size=100))
+    assert [len(chunk) for chunk in chunks] == [100, 100, 40]
+    assert "_id" not in chunks[0].columns
+
+
+def test_tz_aware_columns_round_trip_with_timezone(store, features):
+    local = features.assign(pickup_hour=features["pickup_hour"].dt.tz_localize("America/New_York"))
+    store.write_dataframe(local, COLLECTION)
+
+    out = store.read_dataframe(COLLECTION, timezone="America/New_York")
+    assert len(out.merge(local, on=["PULocationID", "pickup_hour"])) == len(local)
+
+
+def test_nullable_and_date_columns_are_encodable(store, features):
+    features = features.head(3).assign(
+        weathercode=pd.array([1, pd.NA, 3], dtype="Int64"),
+        is_rain=pd.array([True, pd.NA, False], dtype="boolean"),
+        date=features["pickup_hour"].head(3).dt.date,
+    )
+    documents = MongoStore.dataframe_to_documents(features)
+    assert documents[1]["weathercode"] is None and documents[1]["is_rain"] is None
+    assert documents[0]["date"] == "2025-01-01"
+
+    assert store.write_dataframe(features, COLLECTION) == 3